@@ -0,0 +1,63 @@
+"""add users.version row version column
+
+The column is bumped by a BEFORE UPDATE trigger, so every write changes it,
+including bulk updates, raw SQL and manual edits that bypass the ORM.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Databases that already have the column still need the trigger below
+    has_version = False
+    if not op.get_context().as_sql:
+        columns = sa.inspect(op.get_bind()).get_columns("users")
+        has_version = "version" in {column["name"] for column in columns}
+
+    # ADD COLUMN with a constant default and CREATE TRIGGER only touch the
+    # catalog, but they still need strong locks on users; give up rather
+    # than queue every users query behind a long-running transaction
+    op.execute("SET LOCAL lock_timeout = '5s'")
+    if not has_version:
+        op.add_column(
+            "users",
+            sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+        )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION users_bump_version() RETURNS trigger AS $$
+        BEGIN
+            NEW.version := OLD.version + 1;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS users_bump_version ON users")
+    op.execute(
+        """
+        CREATE TRIGGER users_bump_version
+        BEFORE UPDATE ON users
+        FOR EACH ROW
+        WHEN (OLD.* IS DISTINCT FROM NEW.*)
+        EXECUTE FUNCTION users_bump_version()
+        """
+    )
+
+
+def downgrade():
+    op.execute("DROP TRIGGER IF EXISTS users_bump_version ON users")
+    op.execute("DROP FUNCTION IF EXISTS users_bump_version()")
+    op.drop_column("users", "version")
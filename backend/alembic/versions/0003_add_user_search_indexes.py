@@ -0,0 +1,74 @@
+"""add user search indexes
+
+Builds the prefix (lower(col) text_pattern_ops) and substring (pg_trgm)
+indexes used by GET /api/users. They are built CONCURRENTLY so writes to
+users are not blocked for the length of the build, which means each one
+runs outside the migration transaction.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_users_username_lower_pattern", "lower(username) text_pattern_ops", None),
+    ("ix_users_email_lower_pattern", "lower(email) text_pattern_ops", None),
+    ("ix_users_username_trgm", "username gin_trgm_ops", "gin"),
+    ("ix_users_email_trgm", "email gin_trgm_ops", "gin"),
+]
+
+
+def _drop_if_invalid(name):
+    """
+    Drop an index left INVALID by an interrupted concurrent build.
+
+    IF NOT EXISTS would otherwise skip it and leave search unindexed.
+    """
+    if op.get_context().as_sql:
+        return
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND NOT i.indisvalid"
+        ),
+        {"name": name},
+    ).scalar()
+    if invalid:
+        op.drop_index(name, table_name="users", postgresql_concurrently=True)
+
+
+def upgrade():
+    # pg_trgm is a trusted extension, so the database owner can create it
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for name, expression, using in INDEXES:
+            _drop_if_invalid(name)
+            op.create_index(
+                name,
+                "users",
+                [sa.text(expression)],
+                postgresql_using=using,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _, _ in INDEXES:
+            op.drop_index(
+                name,
+                table_name="users",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -51,6 +51,29 @@ class Settings(BaseSettings):
     
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_DIR: str = os.getenv("LOG_DIR", "/app/backend")
+    
+    # Diagnostics
+    DEBUG_ENDPOINTS_ENABLED: bool = Field(
+        default=False,
+        description="Expose superuser-only profiling and memory endpoints"
+    )
+    DEBUG_PROFILE_MAX_SECONDS: float = Field(
+        default=30.0,
+        description="Upper bound on the duration of a sampling CPU profile"
+    )
+    
+    # Load testing
+    LOADTEST_ENDPOINTS_ENABLED: bool = Field(
+        default=False,
+        description="Expose the DB-bound endpoint used by kubernetes/loadtest.yaml"
+    )
+    
+    # Metrics
+    METRICS_SAMPLE_INTERVAL_SECONDS: float = Field(
+        default=1.0,
+        description="How often threadpool and DB pool gauges are refreshed"
+    )
     
     # External Services
     KAFKA_BOOTSTRAP_SERVERS: str = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
@@ -1,7 +1,12 @@
-from sqlalchemy import create_engine
+import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from src.config import settings
+from src.metrics import DB_POOL_WAITING, DB_POOL_WAIT_SECONDS
 
 # SQLAlchemy Database Configuration
 SQLALCHEMY_DATABASE_URL = (
@@ -18,13 +23,49 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Base class for declarative models
 Base = declarative_base()
 
+# Per-thread start time of the pool checkout currently being measured
+_pool_wait = threading.local()
+
+def _end_pool_wait():
+    """Record the pool wait of the current thread's checkout, if any."""
+    started = getattr(_pool_wait, "started", None)
+    if started is None:
+        return
+    _pool_wait.started = None
+    DB_POOL_WAITING.dec()
+    DB_POOL_WAIT_SECONDS.observe(time.perf_counter() - started)
+
+@event.listens_for(engine, "do_connect")
+def _exclude_connection_setup(dialect, conn_rec, cargs, cparams):
+    """
+    Stop the pool wait timer when a new DBAPI connection is opened.
+    
+    A connect only happens once the pool has granted a slot, so the
+    TCP and authentication time that follows is not pool queueing.
+    """
+    _end_pool_wait()
+
 def get_db():
     """
     Dependency that creates a new database session for each request
     and closes it after the request is completed.
+    
+    The connection is checked out up front so that time spent queueing
+    for a pool slot is exported as a metric.
     """
     db = SessionLocal()
     try:
+        try:
+            _pool_wait.started = time.perf_counter()
+            DB_POOL_WAITING.inc()
+            try:
+                db.connection()
+            finally:
+                _end_pool_wait()
+        except SQLAlchemyError:
+            # Leave connection errors to the endpoint's first query,
+            # which reconnects lazily and reports them as before
+            db.rollback()
         yield db
     finally:
         db.close()
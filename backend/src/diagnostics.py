@@ -0,0 +1,268 @@
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import anyio.to_thread
+from sqlalchemy.pool import QueuePool
+
+from src.database import engine
+
+# Only one profile may run at a time; overlapping samplers skew each other
+_profile_lock = threading.Lock()
+
+# Baseline snapshot for tracemalloc diffs
+_last_snapshot: Optional[tracemalloc.Snapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+class ProfilerBusyError(RuntimeError):
+    """Raised when a profile is requested while another one is running."""
+
+
+class ProfilerUnsupportedError(RuntimeError):
+    """Raised when a profile mode is not supported on this platform."""
+
+
+class TracingNotStartedError(RuntimeError):
+    """Raised when tracemalloc data is requested before tracing started."""
+
+
+def _format_frame(frame) -> str:
+    """Render a frame as ``module:function`` for collapsed stacks."""
+    code = frame.f_code
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}:{code.co_name}"
+
+
+def _thread_cpu_time(ident: int) -> Optional[float]:
+    """
+    Read the CPU time consumed by a thread, in seconds.
+
+    Returns:
+        Optional[float]: CPU time, or None if the thread has exited
+    """
+    try:
+        return time.clock_gettime(time.pthread_getcpuclockid(ident))
+    except (OSError, OverflowError):
+        return None
+
+
+def sample_stacks(duration: float, interval: float, mode: str = "cpu") -> str:
+    """
+    Run a time-boxed sampling profile over all Python threads.
+
+    Every ``interval`` seconds the current stack of each thread (other
+    than the sampling one) is recorded. Identical stacks are aggregated.
+    In ``cpu`` mode a stack is only recorded if its thread consumed CPU
+    time since the previous tick, so threads blocked in socket reads,
+    database waits or sleeps are left out; ``wall`` mode records every
+    stack, which shows where requests wait.
+
+    Args:
+        duration (float): How long to sample, in seconds
+        interval (float): Delay between samples, in seconds
+        mode (str): ``cpu`` or ``wall``
+
+    Returns:
+        str: Collapsed stacks (``frame;frame;frame count`` per line),
+            the input format of flamegraph.pl and speedscope
+
+    Raises:
+        ProfilerBusyError: If another profile is already running
+        ProfilerUnsupportedError: If ``cpu`` mode is requested on a
+            platform without per-thread CPU clocks
+    """
+    if mode == "cpu" and not hasattr(time, "pthread_getcpuclockid"):
+        raise ProfilerUnsupportedError(
+            "Per-thread CPU clocks are not available on this platform; "
+            "use mode=wall"
+        )
+    if not _profile_lock.acquire(blocking=False):
+        raise ProfilerBusyError("A profile is already running")
+
+    try:
+        own_ident = threading.get_ident()
+        stacks: Counter = Counter()
+        cpu_times: Dict[int, float] = {}
+        deadline = time.monotonic() + duration
+
+        while time.monotonic() < deadline:
+            # Refresh every tick so threads started mid-profile are named
+            thread_names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                if mode == "cpu":
+                    cpu_time = _thread_cpu_time(ident)
+                    previous = cpu_times.get(ident)
+                    if cpu_time is None:
+                        continue
+                    cpu_times[ident] = cpu_time
+                    # The first tick only sets a baseline for the thread
+                    if previous is None or cpu_time <= previous:
+                        continue
+                frames: List[str] = []
+                while frame is not None:
+                    frames.append(_format_frame(frame))
+                    frame = frame.f_back
+                frames.append(thread_names.get(ident, f"thread-{ident}"))
+                stacks[";".join(reversed(frames))] += 1
+            time.sleep(interval)
+    finally:
+        _profile_lock.release()
+
+    return "\n".join(
+        f"{stack} {count}" for stack, count in stacks.most_common()
+    )
+
+
+def start_tracing(frames: int) -> bool:
+    """
+    Start tracemalloc if it is not already running.
+
+    Args:
+        frames (int): Number of frames stored per allocation traceback
+
+    Returns:
+        bool: True if tracing was started by this call
+    """
+    if tracemalloc.is_tracing():
+        return False
+    tracemalloc.start(frames)
+    return True
+
+
+def stop_tracing() -> bool:
+    """
+    Stop tracemalloc and drop the stored baseline snapshot.
+
+    Returns:
+        bool: True if tracing was running before this call
+    """
+    global _last_snapshot
+
+    was_tracing = tracemalloc.is_tracing()
+    tracemalloc.stop()
+    with _snapshot_lock:
+        _last_snapshot = None
+    return was_tracing
+
+
+def _take_snapshot() -> tracemalloc.Snapshot:
+    """Take a snapshot, excluding tracemalloc's own bookkeeping."""
+    if not tracemalloc.is_tracing():
+        raise TracingNotStartedError("tracemalloc is not tracing")
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+
+
+def top_allocations(limit: int, key_type: str) -> Dict[str, Any]:
+    """
+    Report the largest live allocation sites.
+
+    Args:
+        limit (int): Maximum number of allocation sites to return
+        key_type (str): Grouping key (``lineno``, ``filename`` or ``traceback``)
+
+    Returns:
+        Dict[str, Any]: Traced memory totals and the top allocation sites
+    """
+    stats = _take_snapshot().statistics(key_type)
+    current, peak = tracemalloc.get_traced_memory()
+    return {
+        "traced_current_bytes": current,
+        "traced_peak_bytes": peak,
+        "top": [
+            {
+                "traceback": [str(frame) for frame in stat.traceback],
+                "size_bytes": stat.size,
+                "count": stat.count,
+            }
+            for stat in stats[:limit]
+        ],
+    }
+
+
+def snapshot_diff(limit: int, key_type: str) -> Dict[str, Any]:
+    """
+    Take a snapshot and compare it with the previous one.
+
+    The new snapshot becomes the baseline for the next call, so repeated
+    calls show what grew between them. The first call has no baseline and
+    returns an empty diff.
+
+    Args:
+        limit (int): Maximum number of allocation sites to return
+        key_type (str): Grouping key (``lineno``, ``filename`` or ``traceback``)
+
+    Returns:
+        Dict[str, Any]: Whether a baseline existed and the largest changes
+    """
+    global _last_snapshot
+
+    snapshot = _take_snapshot()
+    with _snapshot_lock:
+        previous, _last_snapshot = _last_snapshot, snapshot
+
+    if previous is None:
+        return {"baseline": False, "diff": []}
+
+    stats = snapshot.compare_to(previous, key_type)
+    return {
+        "baseline": True,
+        "diff": [
+            {
+                "traceback": [str(frame) for frame in stat.traceback],
+                "size_bytes": stat.size,
+                "size_diff_bytes": stat.size_diff,
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            }
+            for stat in stats[:limit]
+        ],
+    }
+
+
+def threadpool_stats() -> Dict[str, int]:
+    """
+    Report occupancy of the threadpool that runs sync endpoints.
+
+    Must be called from the event loop, since AnyIO's default limiter
+    is scoped to it.
+
+    Returns:
+        Dict[str, int]: Limiter capacity, threads in use and waiting tasks
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    return {
+        "total": int(limiter.total_tokens),
+        "in_use": int(limiter.borrowed_tokens),
+        "waiting": limiter.statistics().tasks_waiting,
+    }
+
+
+def db_pool_stats() -> Dict[str, Any]:
+    """
+    Report occupancy of the SQLAlchemy connection pool.
+
+    Returns:
+        Dict[str, Any]: Pool size and connections checked in, checked out
+            and in overflow
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {"pool_class": type(pool).__name__}
+    return {
+        "pool_class": type(pool).__name__,
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
@@ -1,3 +1,4 @@
+import asyncio
 import uvicorn
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,25 +12,24 @@ from sqlalchemy.orm import Session
 import logging
 import sys
 
-from src.database import engine, Base, get_db
-from src.routes import auth_router, user_router
+from src.database import get_db
+from src.routes import auth_router, user_router, debug_router, loadtest_router
+from src import diagnostics, metrics
 from src.config import Settings
 
+settings = Settings()
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),  # Log to console
-        logging.FileHandler('/app/backend/app.log')  # Log to file
+        logging.FileHandler(os.path.join(settings.LOG_DIR, 'app.log'))  # Log to file
     ]
 )
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
-
 # Initialize FastAPI app
-settings = Settings()
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description=settings.PROJECT_DESCRIPTION,
@@ -48,12 +48,57 @@ app.add_middleware(
 # Include routers
 app.include_router(auth_router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(user_router, prefix="/api/users", tags=["Users"])
+if settings.DEBUG_ENDPOINTS_ENABLED:
+    app.include_router(debug_router, prefix="/api/debug", tags=["Debug"])
+if settings.LOADTEST_ENDPOINTS_ENABLED:
+    app.include_router(loadtest_router, prefix="/api/loadtest", tags=["Load Test"])
 
 # Prometheus Metrics
-Instrumentator().instrument(app).expose(app)
+# In-flight requests per route are exported as http_requests_inprogress;
+# the scrape itself is excluded so it does not feed the HPA
+Instrumentator(
+    should_instrument_requests_inprogress=True,
+    inprogress_labels=True,
+    excluded_handlers=["/metrics"]
+).instrument(app).expose(app)
+
+async def sample_pool_metrics():
+    """
+    Periodically publish threadpool and DB pool occupancy gauges.
+    
+    Runs on the event loop, where the threadpool limiter lives, so the
+    samples keep flowing even when every worker thread is busy.
+    """
+    while True:
+        try:
+            metrics.observe_pools(
+                diagnostics.threadpool_stats(),
+                diagnostics.db_pool_stats()
+            )
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Pool metrics sampling failed: {str(e)}")
+        await asyncio.sleep(settings.METRICS_SAMPLE_INTERVAL_SECONDS)
+
+@app.on_event("startup")
+async def start_pool_metrics_sampler():
+    app.state.pool_metrics_task = asyncio.create_task(sample_pool_metrics())
+
+@app.on_event("shutdown")
+async def stop_pool_metrics_sampler():
+    app.state.pool_metrics_task.cancel()
+
+@app.get("/health/live")
+async def liveness_check():
+    """
+    Lightweight probe for Kubernetes liveness and readiness.
+    
+    Touches neither the threadpool nor the DB pool, so a replica that is
+    merely saturated under load keeps passing its probes.
+    """
+    return {"status": "alive"}
 
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+def health_check(db: Session = Depends(get_db)):
     try:
         # Attempt to execute a simple database query
         db.execute(text("SELECT 1"))
@@ -0,0 +1,62 @@
+from typing import Any, Dict
+
+from prometheus_client import Gauge, Histogram
+
+# Sync endpoints run on AnyIO's worker threadpool; once every thread is
+# busy, further requests queue here while CPU can stay low
+THREADPOOL_THREADS_TOTAL = Gauge(
+    "app_threadpool_threads_total",
+    "Capacity of the threadpool running sync endpoints and dependencies"
+)
+THREADPOOL_THREADS_IN_USE = Gauge(
+    "app_threadpool_threads_in_use",
+    "Threadpool threads currently running sync work"
+)
+THREADPOOL_QUEUE_DEPTH = Gauge(
+    "app_threadpool_queue_depth",
+    "Tasks waiting for a free threadpool thread"
+)
+
+# SQLAlchemy connection pool occupancy
+DB_POOL_SIZE = Gauge(
+    "app_db_pool_size",
+    "Configured size of the database connection pool"
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "app_db_pool_checked_out",
+    "Database connections currently checked out of the pool"
+)
+DB_POOL_OVERFLOW = Gauge(
+    "app_db_pool_overflow",
+    "Database connections opened beyond the pool size"
+)
+DB_POOL_WAITING = Gauge(
+    "app_db_pool_waiting",
+    "Requests currently queued for a database connection pool slot"
+)
+DB_POOL_WAIT_SECONDS = Histogram(
+    "app_db_pool_wait_seconds",
+    "Time spent queued for a database connection pool slot, "
+    "excluding new-connection setup",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+)
+
+
+def observe_pools(threadpool: Dict[str, int], db_pool: Dict[str, Any]) -> None:
+    """
+    Publish a sample of threadpool and database pool occupancy.
+
+    Args:
+        threadpool (Dict[str, int]): Output of ``diagnostics.threadpool_stats``
+        db_pool (Dict[str, Any]): Output of ``diagnostics.db_pool_stats``
+    """
+    THREADPOOL_THREADS_TOTAL.set(threadpool["total"])
+    THREADPOOL_THREADS_IN_USE.set(threadpool["in_use"])
+    THREADPOOL_QUEUE_DEPTH.set(threadpool["waiting"])
+
+    # Pools without a fixed size (e.g. NullPool) only report their class
+    if "size" in db_pool:
+        DB_POOL_SIZE.set(db_pool["size"])
+        DB_POOL_CHECKED_OUT.set(db_pool["checked_out"])
+        # QueuePool reports unused overflow slots as a negative number
+        DB_POOL_OVERFLOW.set(max(db_pool["overflow"], 0))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index
 from sqlalchemy.sql import func
 from src.database import Base
 
@@ -14,9 +14,9 @@ class User(Base):
         is_active (bool): User account status
         is_superuser (bool): Admin/superuser status
         created_at (DateTime): User account creation timestamp
+        version (int): Row version, incremented by a trigger on every update
     """
     __tablename__ = "users"
-
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String, unique=True, index=True, nullable=False)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -24,6 +24,39 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    version = Column(Integer, nullable=False, server_default="1")
+
+    # Search indexes, created by the 0003 migration
+    __table_args__ = (
+        # Case-insensitive prefix search (lower(col) LIKE 'abc%') regardless
+        # of the database collation
+        Index(
+            "ix_users_username_lower_pattern",
+            func.lower(username).label("username_lower"),
+            postgresql_ops={"username_lower": "text_pattern_ops"}
+        ),
+        Index(
+            "ix_users_email_lower_pattern",
+            func.lower(email).label("email_lower"),
+            postgresql_ops={"email_lower": "text_pattern_ops"}
+        ),
+        # Substring search (ILIKE '%abc%'); requires the pg_trgm extension
+        Index(
+            "ix_users_username_trgm", username,
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_users_email_trgm", email,
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"}
+        ),
+    )
+
+    # The users_bump_version trigger (migration 0002) increments version on
+    # every UPDATE; the ORM only reads it back and uses it for optimistic
+    # concurrency checks, so ORM writes are not bumped twice
+    __mapper_args__ = {"version_id_col": version, "version_id_generator": False}
 
     def __repr__(self):
         return f"<User {self.username}>"
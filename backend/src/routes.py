@@ -1,9 +1,13 @@
 from datetime import timedelta, datetime
-from typing import List
+from typing import List, Optional
+import hashlib
+import json
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import PlainTextResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy import func, text
+from sqlalchemy.orm import Query as SQLQuery, Session, load_only
 
 from src.database import get_db
 from src.models import User
@@ -24,10 +28,13 @@ from src.security import (
     get_password_hash, 
     verify_password, 
     get_current_user,
-    get_current_active_user
+    get_current_active_user,
+    get_current_active_superuser
 )
 from src.config import settings
+from src import diagnostics
 import logging
+import os
 import sys
 import platform
 import psutil
@@ -38,7 +45,7 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('/app/backend/routes.log')
+        logging.FileHandler(os.path.join(settings.LOG_DIR, 'routes.log'))
     ]
 )
 logger = logging.getLogger(__name__)
@@ -49,6 +56,80 @@ auth_router = APIRouter()
 # User Router
 user_router = APIRouter()
 
+# Debug Router (superuser-only, mounted when DEBUG_ENDPOINTS_ENABLED is set)
+debug_router = APIRouter(dependencies=[Depends(get_current_active_superuser)])
+
+# Load Test Router (mounted when LOADTEST_ENDPOINTS_ENABLED is set)
+loadtest_router = APIRouter()
+
+# Force clients to revalidate with If-None-Match instead of reusing stale bodies
+USER_CACHE_CONTROL = "private, no-cache"
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag.
+    
+    Args:
+        request (Request): Incoming request
+        etag (str): Current ETag of the resource
+    
+    Returns:
+        bool: True if the client already holds the current representation
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so ignore any W/ prefix
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(
+        (tag[2:] if tag.startswith("W/") else tag) == etag
+        for tag in candidates
+    )
+
+# Escape character for LIKE patterns built from user input
+LIKE_ESCAPE = "/"
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally."""
+    return (value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+                 .replace("%", LIKE_ESCAPE + "%")
+                 .replace("_", LIKE_ESCAPE + "_"))
+
+def _estimate_count(db: Session, query: SQLQuery) -> int:
+    """
+    Estimate the number of rows a query returns from planner statistics.
+    
+    Runs EXPLAIN instead of COUNT(*), so the cost does not grow with the
+    size of the table. Accuracy depends on how recently it was ANALYZEd.
+    
+    Args:
+        db (Session): Database session
+        query (SQLQuery): Filtered query, without ordering or pagination
+    
+    Returns:
+        int: Planner's row estimate
+    """
+    # Planner statistics are PostgreSQL-specific (tests run on SQLite)
+    if db.bind.dialect.name != "postgresql":
+        return query.order_by(None).count()
+    
+    compiled = query.statement.compile(dialect=db.bind.dialect)
+    result = db.connection().exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params
+    ).scalar()
+    # psycopg2 decodes json columns, other drivers may return the raw text
+    plan = json.loads(result) if isinstance(result, str) else result
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+def _not_modified(etag: str) -> Response:
+    """Build an empty 304 response carrying the validator headers."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": USER_CACHE_CONTROL}
+    )
+
 @auth_router.post("/register", response_model=UserResponse)
 def register_user(user: UserCreate, db: Session = Depends(get_db)):
     """
@@ -260,31 +341,69 @@ def get_app_metadata(
     )
 
 @user_router.get("/me", response_model=UserResponse)
-def read_users_me(current_user: User = Depends(get_current_active_user)):
+def read_users_me(
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_active_user)
+):
     """
     Get the current authenticated user's details.
     
+    Supports conditional requests: the ETag is derived from the user's
+    row version, and a matching If-None-Match yields 304 Not Modified.
+    
     Args:
+        request (Request): Incoming request
+        response (Response): Outgoing response, used to set cache headers
         current_user (User): Authenticated user
     
     Returns:
         UserResponse: Current user details
     """
+    etag = f'"user-{current_user.id}-v{current_user.version}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = USER_CACHE_CONTROL
     return current_user
 
 @user_router.get("/", response_model=List[UserResponse])
 def read_users(
+    request: Request,
+    response: Response,
     skip: int = 0, 
     limit: int = 100, 
+    q: Optional[str] = Query(None, min_length=1, max_length=100),
+    match: str = Query("prefix", regex="^(prefix|contains)$"),
+    is_active: Optional[bool] = None,
+    is_superuser: Optional[bool] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
-    Retrieve a list of users (admin-only endpoint).
+    Retrieve and search a list of users (admin-only endpoint).
+    
+    ``q`` is matched case-insensitively against username or email, either
+    as a prefix (served by the lower() text_pattern_ops indexes) or as a
+    substring (served by the trigram indexes). Substring terms shorter than
+    three characters cannot use a trigram index and scan the table.
+    The planner's estimate of matching users is returned in the
+    X-Total-Count-Estimate header.
+    
+    Supports conditional requests: the ETag is derived from the ids and
+    row versions in the requested page, which are read first; a matching
+    If-None-Match yields 304 Not Modified without loading the full rows.
     
     Args:
+        request (Request): Incoming request
+        response (Response): Outgoing response, used to set cache headers
         skip (int): Number of users to skip
         limit (int): Maximum number of users to return
+        q (Optional[str]): Search term for username or email
+        match (str): How to match ``q``, either "prefix" or "contains"
+        is_active (Optional[bool]): Only return users with this status
+        is_superuser (Optional[bool]): Only return users with this role
         db (Session): Database session
         current_user (User): Authenticated user
     
@@ -297,5 +416,181 @@ def read_users(
             detail="Not authorized to list users"
         )
     
-    users = db.query(User).offset(skip).limit(limit).all()
+    query = db.query(User)
+    if q:
+        if match == "contains":
+            pattern = f"%{_escape_like(q)}%"
+            query = query.filter(
+                User.username.ilike(pattern, escape=LIKE_ESCAPE) |
+                User.email.ilike(pattern, escape=LIKE_ESCAPE)
+            )
+        else:
+            # Matches the lower(col) text_pattern_ops expression indexes
+            pattern = f"{_escape_like(q.lower())}%"
+            query = query.filter(
+                func.lower(User.username).like(pattern, escape=LIKE_ESCAPE) |
+                func.lower(User.email).like(pattern, escape=LIKE_ESCAPE)
+            )
+    if is_active is not None:
+        query = query.filter(User.is_active == is_active)
+    if is_superuser is not None:
+        query = query.filter(User.is_superuser == is_superuser)
+    
+    page = query.order_by(User.id).offset(skip).limit(limit)
+    
+    # Derive the ETag from (id, version) pairs alone, so an unchanged page
+    # costs an index-friendly two-column read and a header comparison
+    versions = page.with_entities(User.id, User.version).all()
+    digest = hashlib.sha1(
+        ",".join(f"{row.id}:{row.version}" for row in versions).encode()
+    ).hexdigest()
+    etag = f'"users-{digest}"'
+    if _etag_matches(request, etag):
+        return _not_modified(etag)
+    
+    # Only load the columns UserResponse needs
+    users = (page
+             .options(load_only(
+                 User.id, User.username, User.email,
+                 User.is_active, User.created_at
+             ))
+             .all())
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = USER_CACHE_CONTROL
+    response.headers["X-Total-Count-Estimate"] = str(_estimate_count(db, query))
     return users
+
+@debug_router.get("/profile", response_class=PlainTextResponse)
+def profile_cpu(
+    seconds: float = Query(5.0, gt=0),
+    interval_ms: float = Query(10.0, ge=1, le=1000),
+    mode: str = Query("cpu", regex="^(cpu|wall)$")
+):
+    """
+    Run a sampling CPU profile of the process.
+    
+    Samples the stacks of all threads for the requested duration and
+    returns them in collapsed-stack format, ready for flamegraph.pl or
+    speedscope. The default ``cpu`` mode only counts threads that used CPU
+    time since the previous sample; ``wall`` counts every thread, which
+    shows where requests block.
+    
+    Args:
+        seconds (float): Profile duration, capped by DEBUG_PROFILE_MAX_SECONDS
+        interval_ms (float): Sampling interval in milliseconds
+        mode (str): Either "cpu" or "wall"
+    
+    Returns:
+        str: Collapsed stacks with sample counts
+    """
+    duration = min(seconds, settings.DEBUG_PROFILE_MAX_SECONDS)
+    try:
+        return diagnostics.sample_stacks(duration, interval_ms / 1000, mode)
+    except diagnostics.ProfilerBusyError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except diagnostics.ProfilerUnsupportedError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+@debug_router.post("/memory/start")
+def start_memory_tracing(frames: int = Query(1, ge=1, le=50)):
+    """
+    Start tracemalloc allocation tracing.
+    
+    Args:
+        frames (int): Number of frames stored per allocation traceback
+    
+    Returns:
+        dict: Whether tracing was started by this call
+    """
+    return {"started": diagnostics.start_tracing(frames)}
+
+@debug_router.post("/memory/stop")
+def stop_memory_tracing():
+    """
+    Stop tracemalloc allocation tracing and discard the baseline snapshot.
+    
+    Returns:
+        dict: Whether tracing was running
+    """
+    return {"stopped": diagnostics.stop_tracing()}
+
+@debug_router.get("/memory/top")
+def read_memory_top(
+    limit: int = Query(20, ge=1, le=500),
+    key_type: str = Query("lineno", regex="^(lineno|filename|traceback)$")
+):
+    """
+    Report the top live allocation sites recorded by tracemalloc.
+    
+    Args:
+        limit (int): Maximum number of allocation sites
+        key_type (str): Grouping key for the statistics
+    
+    Returns:
+        dict: Traced memory totals and top allocation sites
+    """
+    try:
+        return diagnostics.top_allocations(limit, key_type)
+    except diagnostics.TracingNotStartedError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+@debug_router.post("/memory/snapshot")
+def take_memory_snapshot(
+    limit: int = Query(20, ge=1, le=500),
+    key_type: str = Query("lineno", regex="^(lineno|filename|traceback)$")
+):
+    """
+    Take a tracemalloc snapshot and diff it against the previous one.
+    
+    Args:
+        limit (int): Maximum number of allocation sites
+        key_type (str): Grouping key for the statistics
+    
+    Returns:
+        dict: Largest allocation changes since the previous snapshot
+    """
+    try:
+        return diagnostics.snapshot_diff(limit, key_type)
+    except diagnostics.TracingNotStartedError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+@debug_router.get("/pools")
+async def read_pool_occupancy():
+    """
+    Report threadpool and database connection pool occupancy.
+    
+    Declared async so it runs on the event loop, where the threadpool
+    limiter lives, and is not itself queued behind a saturated pool.
+    
+    Returns:
+        dict: Threadpool and database pool statistics
+    """
+    return {
+        "threadpool": diagnostics.threadpool_stats(),
+        "db_pool": diagnostics.db_pool_stats()
+    }
+
+@loadtest_router.get("/db-wait")
+def wait_on_database(
+    seconds: float = Query(0.2, gt=0, le=2),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Hold a database connection for a while without using CPU.
+    
+    Runs pg_sleep on a pooled connection, so concurrent callers queue on
+    the threadpool and DB pool while the process stays mostly idle. Used
+    by the HPA load test to show scaling on concurrency metrics.
+    
+    Args:
+        seconds (float): How long the query sleeps
+        db (Session): Database session
+        current_user (User): Authenticated user
+    
+    Returns:
+        dict: The requested sleep duration
+    """
+    db.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": seconds})
+    return {"slept_seconds": seconds}
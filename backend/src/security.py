@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from typing import Optional
 import logging
+import os
 import sys
 
 from fastapi import Depends, HTTPException, status
@@ -19,7 +20,7 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('/app/backend/security.log')
+        logging.FileHandler(os.path.join(settings.LOG_DIR, 'security.log'))
     ]
 )
 logger = logging.getLogger(__name__)
@@ -137,3 +138,19 @@ def get_current_active_user(
             detail="Inactive user"
         )
     return current_user
+
+def get_current_active_superuser(
+    current_user: User = Depends(get_current_active_user)
+) -> User:
+    """
+    Get the current active user, requiring superuser privileges.
+    
+    Raises:
+        HTTPException: If user is not a superuser
+    """
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Superuser privileges required"
+        )
+    return current_user
@@ -0,0 +1,90 @@
+import os
+import tempfile
+
+# The app logs to files under LOG_DIR at import time
+os.environ.setdefault("LOG_DIR", tempfile.mkdtemp())
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database import Base, get_db
+from src.main import app
+from src.models import User
+from src.security import create_access_token
+
+# SQLite stand-in for the users_bump_version trigger from migration 0002
+SQLITE_BUMP_VERSION_TRIGGER = """
+CREATE TRIGGER users_bump_version AFTER UPDATE ON users
+FOR EACH ROW WHEN NEW.version = OLD.version
+BEGIN
+    UPDATE users SET version = OLD.version + 1 WHERE id = NEW.id;
+END
+"""
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        connection.execute(text(SQLITE_BUMP_VERSION_TRIGGER))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(engine):
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def make_user(db):
+    """Insert a user directly, bypassing registration and password hashing."""
+    def _make_user(username, email=None, is_active=True, is_superuser=False):
+        user = User(
+            username=username,
+            email=email or f"{username}@example.com",
+            hashed_password="not-a-real-hash",
+            is_active=is_active,
+            is_superuser=is_superuser,
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return user
+    return _make_user
+
+
+@pytest.fixture
+def auth_headers():
+    """Build an Authorization header for a user."""
+    def _auth_headers(user):
+        token = create_access_token(data={"sub": user.username})
+        return {"Authorization": f"Bearer {token}"}
+    return _auth_headers
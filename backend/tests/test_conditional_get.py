@@ -0,0 +1,163 @@
+from sqlalchemy import text
+
+import pytest
+
+
+@pytest.fixture
+def user(make_user):
+    return make_user("alice")
+
+
+@pytest.fixture
+def admin(make_user):
+    return make_user("admin", is_superuser=True)
+
+
+def test_me_sends_etag_and_cache_control(client, user, auth_headers):
+    response = client.get("/api/users/me", headers=auth_headers(user))
+
+    assert response.status_code == 200
+    assert response.headers["ETag"].startswith('"')
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+
+def test_me_matching_etag_returns_empty_304(client, user, auth_headers):
+    etag = client.get("/api/users/me", headers=auth_headers(user)).headers["ETag"]
+
+    response = client.get(
+        "/api/users/me",
+        headers={**auth_headers(user), "If-None-Match": etag},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+
+@pytest.mark.parametrize("if_none_match", [
+    "W/{etag}",
+    '"stale", {etag}',
+    '"stale",W/{etag}',
+    "*",
+])
+def test_me_if_none_match_forms(client, user, auth_headers, if_none_match):
+    etag = client.get("/api/users/me", headers=auth_headers(user)).headers["ETag"]
+
+    response = client.get(
+        "/api/users/me",
+        headers={**auth_headers(user), "If-None-Match": if_none_match.format(etag=etag)},
+    )
+
+    assert response.status_code == 304
+
+
+def test_me_stale_etag_returns_body(client, user, auth_headers):
+    response = client.get(
+        "/api/users/me",
+        headers={**auth_headers(user), "If-None-Match": '"stale"'},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["username"] == "alice"
+
+
+def test_me_etag_changes_after_orm_update(client, db, user, auth_headers):
+    etag = client.get("/api/users/me", headers=auth_headers(user)).headers["ETag"]
+
+    user.email = "alice@changed.example.com"
+    db.commit()
+
+    response = client.get(
+        "/api/users/me",
+        headers={**auth_headers(user), "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["email"] == "alice@changed.example.com"
+
+
+def test_me_etag_changes_after_raw_sql_update(client, db, user, auth_headers):
+    etag = client.get("/api/users/me", headers=auth_headers(user)).headers["ETag"]
+
+    db.execute(
+        text("UPDATE users SET email = :email WHERE id = :id"),
+        {"email": "alice@sql.example.com", "id": user.id},
+    )
+    db.commit()
+
+    response = client.get(
+        "/api/users/me",
+        headers={**auth_headers(user), "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_orm_update_bumps_version_once(db, user):
+    assert user.version == 1
+
+    user.is_active = False
+    db.commit()
+
+    assert user.version == 2
+
+
+def test_listing_matching_etag_returns_empty_304(client, admin, user, auth_headers):
+    etag = client.get("/api/users/", headers=auth_headers(admin)).headers["ETag"]
+
+    response = client.get(
+        "/api/users/",
+        headers={**auth_headers(admin), "If-None-Match": etag},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_listing_etag_changes_when_row_on_page_changes(
+    client, db, admin, user, auth_headers
+):
+    etag = client.get("/api/users/", headers=auth_headers(admin)).headers["ETag"]
+
+    user.email = "alice@changed.example.com"
+    db.commit()
+
+    response = client.get(
+        "/api/users/",
+        headers={**auth_headers(admin), "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_listing_etag_ignores_rows_off_the_page(
+    client, db, admin, user, make_user, auth_headers
+):
+    bob = make_user("bob")
+    headers = auth_headers(admin)
+    etag = client.get("/api/users/?limit=2", headers=headers).headers["ETag"]
+
+    bob.email = "bob@changed.example.com"
+    db.commit()
+
+    response = client.get(
+        "/api/users/?limit=2",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert response.status_code == 304
+
+
+def test_listing_etag_changes_when_row_is_deleted(
+    client, db, admin, user, auth_headers
+):
+    etag = client.get("/api/users/", headers=auth_headers(admin)).headers["ETag"]
+
+    db.delete(user)
+    db.commit()
+
+    response = client.get(
+        "/api/users/",
+        headers={**auth_headers(admin), "If-None-Match": etag},
+    )
+    assert response.status_code == 200
+    assert [u["username"] for u in response.json()] == ["admin"]
@@ -0,0 +1,131 @@
+import pytest
+
+
+@pytest.fixture
+def admin(make_user):
+    return make_user("admin", is_superuser=True)
+
+
+def _search(client, headers, **params):
+    response = client.get("/api/users/", headers=headers, params=params)
+    assert response.status_code == 200
+    return sorted(u["username"] for u in response.json())
+
+
+def test_listing_requires_superuser(client, make_user, auth_headers):
+    user = make_user("alice")
+
+    response = client.get("/api/users/", headers=auth_headers(user))
+
+    assert response.status_code == 403
+
+
+def test_prefix_is_case_insensitive(client, admin, make_user, auth_headers):
+    make_user("Alice")
+    make_user("malice")
+
+    assert _search(client, auth_headers(admin), q="ALI") == ["Alice"]
+
+
+def test_prefix_matches_email(client, admin, make_user, auth_headers):
+    make_user("carol", email="Carol.Smith@example.org")
+
+    assert _search(client, auth_headers(admin), q="carol.s") == ["carol"]
+
+
+def test_underscore_is_matched_literally(client, admin, make_user, auth_headers):
+    make_user("bob_x")
+    make_user("bobby")
+
+    assert _search(client, auth_headers(admin), q="bob_") == ["bob_x"]
+
+
+def test_percent_is_matched_literally(client, admin, make_user, auth_headers):
+    make_user("100%off")
+    make_user("100off")
+
+    headers = auth_headers(admin)
+    assert _search(client, headers, q="100%") == ["100%off"]
+    assert _search(client, headers, q="0%o", match="contains") == ["100%off"]
+
+
+def test_escape_character_is_matched_literally(
+    client, admin, make_user, auth_headers
+):
+    make_user("a/b")
+    make_user("ab")
+
+    assert _search(client, auth_headers(admin), q="a/") == ["a/b"]
+
+
+def test_contains_short_term(client, admin, make_user, auth_headers):
+    make_user("bob_x")
+    make_user("bobby")
+    make_user("carol")
+
+    headers = auth_headers(admin)
+    assert _search(client, headers, q="ob", match="contains") == ["bob_x", "bobby"]
+    # Every user, admin included, has an example.com address
+    assert _search(client, headers, q="ex", match="contains") == [
+        "admin", "bob_x", "bobby", "carol"
+    ]
+
+
+def test_contains_is_case_insensitive(client, admin, make_user, auth_headers):
+    make_user("DaveJones")
+
+    assert _search(client, auth_headers(admin), q="vej", match="contains") == [
+        "DaveJones"
+    ]
+
+
+def test_is_active_filter(client, admin, make_user, auth_headers):
+    make_user("alice")
+    make_user("bob", is_active=False)
+
+    headers = auth_headers(admin)
+    assert _search(client, headers, is_active="false") == ["bob"]
+    assert _search(client, headers, is_active="true") == ["admin", "alice"]
+
+
+def test_is_superuser_filter(client, admin, make_user, auth_headers):
+    make_user("alice")
+    make_user("root", is_superuser=True)
+
+    headers = auth_headers(admin)
+    assert _search(client, headers, is_superuser="true") == ["admin", "root"]
+    assert _search(client, headers, is_superuser="false") == ["alice"]
+
+
+def test_filters_combine_with_search(client, admin, make_user, auth_headers):
+    make_user("bob_x")
+    make_user("bobby", is_active=False)
+
+    assert _search(
+        client, auth_headers(admin), q="bob", is_active="true"
+    ) == ["bob_x"]
+
+
+def test_total_count_estimate_header(client, admin, make_user, auth_headers):
+    for name in ("ann", "anna", "annie"):
+        make_user(name)
+
+    response = client.get(
+        "/api/users/",
+        headers=auth_headers(admin),
+        params={"q": "ann", "limit": 2},
+    )
+
+    assert len(response.json()) == 2
+    assert response.headers["X-Total-Count-Estimate"] == "3"
+
+
+@pytest.mark.parametrize("params", [
+    {"q": ""},
+    {"q": "a" * 101},
+    {"match": "regex"},
+])
+def test_invalid_search_params(client, admin, auth_headers, params):
+    response = client.get("/api/users/", headers=auth_headers(admin), params=params)
+
+    assert response.status_code == 422